@@ -0,0 +1,25 @@
+"""
+JSON provider for the Flask app backed by orjson.
+
+orjson parses and serializes large strings (such as base64 audio
+payloads) considerably faster than the standard library json module.
+"""
+
+from typing import Any, Union
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using orjson for request parsing and jsonify."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
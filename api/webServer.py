@@ -7,31 +7,59 @@ for voice recording, translation, and audio playback.
 
 from flask import Flask, render_template, request, jsonify, send_file
 from flask_cors import CORS
+import atexit
+import glob
+import io
 import os
 import tempfile
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+import av
 import numpy as np
 import soundfile as sf
-from typing import Optional, Tuple
+import soxr
+from cachetools import TTLCache
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Tuple
 from models.voiceTranslator import VoiceTranslator
 from models.utils.languageConfig import LanguageConfig, LanguageCode
+from api.utils.jsonProvider import OrjsonProvider
 import threading
 import uuid
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # Faster parsing of large base64 request bodies
 CORS(app)  # Enable CORS for cross-origin requests
 
-# Global translator instance
-translator: Optional[VoiceTranslator] = None
+# Translator instances keyed by (sourceLanguage, targetLanguage), oldest first
+translatorCache: "OrderedDict[Tuple[str, str], VoiceTranslator]" = OrderedDict()
 translatorLock = threading.Lock()
+MAX_CACHED_TRANSLATORS = 4
 
-# Temporary storage for audio files
-audioStorage = {}
+# Futures resolving to translated WAV bytes, keyed by audio ID and evicted after 5 minutes
+audioStorage: "TTLCache[str, Future]" = TTLCache(maxsize=64, ttl=300)
+audioStorageLock = threading.Lock()
+
+# Encodes translated audio off the request thread
+audioEncodePool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='AudioEncode')
+
+# Temporary files written by earlier versions that stored audio on disk
+LEGACY_AUDIO_PATTERN = os.path.join(tempfile.gettempdir(), 'translated_*-*-*-*-*.wav')
+
+# Sample rate expected by the translation models
+TARGET_SAMPLE_RATE = 16000
 
 
 def getTranslator(sourceLanguage: str, targetLanguage: str) -> VoiceTranslator:
     """
     Get or create translator instance.
     
+    Instances are kept in a small cache so switching direction
+    does not reload the models each time.
+    
     Args:
         sourceLanguage: Source language code
         targetLanguage: Target language code
@@ -39,19 +67,125 @@ def getTranslator(sourceLanguage: str, targetLanguage: str) -> VoiceTranslator:
     Returns:
         VoiceTranslator instance
     """
-    global translator
+    key = (sourceLanguage, targetLanguage)
+    
+    # Fast path: cached translators are returned without taking the lock.
+    # Recency is therefore only tracked on insertion, which is fine for a
+    # cache that holds more pairs than there are supported directions.
+    translator = translatorCache.get(key)
+    if translator is not None:
+        return translator
     
     with translatorLock:
-        if translator is None or \
-           translator.sourceLanguage != sourceLanguage or \
-           translator.targetLanguage != targetLanguage:
-            translator = VoiceTranslator(
-                sourceLanguage=sourceLanguage,
-                targetLanguage=targetLanguage
-            )
+        # Another request may have built it while we waited for the lock
+        if key in translatorCache:
+            return translatorCache[key]
+        
+        translator = VoiceTranslator(
+            sourceLanguage=sourceLanguage,
+            targetLanguage=targetLanguage
+        )
+        translatorCache[key] = translator
+        
+        # Evict the oldest translator and free its models
+        if len(translatorCache) > MAX_CACHED_TRANSLATORS:
+            _, evicted = translatorCache.popitem(last=False)
+            if hasattr(evicted, 'cleanup'):
+                evicted.cleanup()
+        
         return translator
 
 
+def decodeAudio(audioBytes: bytes, audioFormat: str) -> Tuple[np.ndarray, int]:
+    """
+    Decode encoded audio bytes in memory into a mono float32 array.
+    
+    WAV uploads are read directly with soundfile; any other container
+    (webm, ogg, ...) is decoded in-process with PyAV.
+    
+    Args:
+        audioBytes: Encoded audio bytes
+        audioFormat: Audio container format reported by the client
+    
+    Returns:
+        Tuple of (audioArray, sampleRate) at the native sample rate
+    """
+    if audioFormat == 'wav':
+        # Fast path for the web client, which uploads 16 kHz mono WAV
+        audioArray, sampleRate = sf.read(io.BytesIO(audioBytes), dtype='float32')
+        if audioArray.ndim > 1:
+            audioArray = audioArray.mean(axis=1)
+        return audioArray, sampleRate
+    
+    with av.open(io.BytesIO(audioBytes)) as container:
+        # Planar float output gives one row per channel from to_ndarray()
+        resampler = av.AudioResampler(format='fltp')
+        chunks = []
+        sampleRate = None
+        for frame in container.decode(audio=0):
+            sampleRate = sampleRate or frame.sample_rate
+            for planarFrame in resampler.resample(frame):
+                chunks.append(planarFrame.to_ndarray())
+    
+    if not chunks:
+        raise ValueError('No audio frames found')
+    
+    audioArray = np.concatenate(chunks, axis=1)
+    if audioArray.shape[0] > 1:
+        audioArray = audioArray.mean(axis=0)
+    else:
+        audioArray = audioArray[0]
+    
+    return audioArray, sampleRate
+
+
+def warmUpTranslators():
+    """
+    Preload translators so the first request does not pay the model-load cost.
+    
+    The default direction (pt-BR -> en) is loaded synchronously; the reverse
+    direction is loaded in a background thread.
+    """
+    getTranslator(LanguageCode.PORTUGUESE_BR, LanguageCode.ENGLISH)
+    threading.Thread(
+        target=getTranslator,
+        args=(LanguageCode.ENGLISH, LanguageCode.PORTUGUESE_BR),
+        daemon=True
+    ).start()
+
+
+def removeLegacyTempAudio():
+    """
+    Delete translated_<uuid>.wav files left in the temp directory.
+    
+    Older versions of the server wrote every translation there and never
+    removed them; translated audio is now kept in memory only.
+    """
+    for audioPath in glob.glob(LEGACY_AUDIO_PATTERN):
+        try:
+            os.remove(audioPath)
+        except OSError:
+            pass
+
+
+atexit.register(removeLegacyTempAudio)
+
+
+def encodeWav(audio: np.ndarray) -> bytes:
+    """
+    Encode translated audio as 16-bit PCM WAV bytes.
+    
+    Args:
+        audio: Audio samples at 16 kHz
+    
+    Returns:
+        WAV file contents
+    """
+    wavBuffer = io.BytesIO()
+    sf.write(wavBuffer, audio, 16000, format='WAV', subtype='PCM_16')
+    return wavBuffer.getvalue()
+
+
 @app.route('/')
 def index():
     """Serve main page."""
@@ -82,14 +216,28 @@ def translate():
     Expected JSON:
     {
         "audioData": "base64 encoded audio data" (optional),
+        "audioFormat": "webm",
         "sourceLanguage": "pt-BR",
         "targetLanguage": "en"
     }
+    
+    Alternatively, the raw audio bytes can be posted with
+    Content-Type: application/octet-stream, passing sourceLanguage,
+    targetLanguage and audioFormat as query string parameters.
+    
+    The web client uploads 16 kHz mono PCM WAV (audioFormat "wav"), which
+    is read directly with soundfile and needs no resampling. Other formats
+    and rates are still accepted and converted on the server.
     """
     try:
-        data = request.get_json()
+        if request.mimetype == 'application/octet-stream':
+            data = request.args
+            audioBytes = request.get_data(cache=False)
+        else:
+            data = request.get_json()
+            audioBytes = None
         
-        if not data:
+        if not data and not audioBytes:
             return jsonify({'error': 'No data provided'}), 400
         
         sourceLanguage = data.get('sourceLanguage', LanguageCode.PORTUGUESE_BR)
@@ -107,43 +255,33 @@ def translate():
         translatorInstance = getTranslator(sourceLanguage, targetLanguage)
         
         # Handle audio data
-        audioData = data.get('audioData')
-        if not audioData:
+        audioData = data.get('audioData') if audioBytes is None else None
+        if not audioBytes and not audioData:
             return jsonify({'error': 'No audio data provided'}), 400
         
-        # Decode base64 audio data and convert to WAV
-        import base64
-        from pydub import AudioSegment
-        import io
-        
+        # Decode base64 audio data
         try:
-            # Remove data URL prefix if present
-            audioDataClean = audioData.split(',')[1] if ',' in audioData else audioData
-            audioBytes = base64.b64decode(audioDataClean)
+            if audioBytes is None:
+                # Legacy JSON clients: remove data URL prefix if present
+                # (the web client posts raw application/octet-stream bytes)
+                prefixEnd = audioData.find(',')
+                audioDataClean = audioData[prefixEnd + 1:] if prefixEnd != -1 else audioData
+                audioBytes = base64.b64decode(audioDataClean)
             
             # Get audio format from request or default to webm
             audioFormat = data.get('audioFormat', 'webm')
             
-            # Create AudioSegment from bytes
-            audioSegment = AudioSegment.from_file(
-                io.BytesIO(audioBytes),
-                format=audioFormat
-            )
+            audioArray, sampleRate = decodeAudio(audioBytes, audioFormat)
             
-            # Convert to mono and 16kHz
-            audioSegment = audioSegment.set_channels(1)
-            audioSegment = audioSegment.set_frame_rate(16000)
-            
-            # Export to WAV bytes
-            wavBuffer = io.BytesIO()
-            audioSegment.export(wavBuffer, format="wav")
-            wavBytes = wavBuffer.getvalue()
-            
-            # Convert to numpy array (skip WAV header, start from byte 44)
-            audioArray = np.frombuffer(wavBytes[44:], dtype=np.int16)
-            audioArray = audioArray.astype(np.float32) / 32768.0
-            
-            sampleRate = 16000
+            # Resample to the rate expected by the models
+            if sampleRate != TARGET_SAMPLE_RATE:
+                audioArray = soxr.resample(
+                    audioArray,
+                    sampleRate,
+                    TARGET_SAMPLE_RATE,
+                    quality='HQ'
+                )
+                sampleRate = TARGET_SAMPLE_RATE
             
         except Exception as e:
             return jsonify({'error': f'Failed to decode audio: {str(e)}'}), 400
@@ -157,11 +295,10 @@ def translate():
                 returnText=True
             )
             
-            # Save translated audio to temporary file
+            # Encode translated audio in the background; getAudio waits for it
             audioId = str(uuid.uuid4())
-            audioPath = os.path.join(tempfile.gettempdir(), f"translated_{audioId}.wav")
-            sf.write(audioPath, translatedAudio, 16000)
-            audioStorage[audioId] = audioPath
+            with audioStorageLock:
+                audioStorage[audioId] = audioEncodePool.submit(encodeWav, translatedAudio)
             
             return jsonify({
                 'success': True,
@@ -185,18 +322,27 @@ def getAudio(audioId: str):
     Args:
         audioId: Audio file ID returned from translate endpoint
     """
-    if audioId not in audioStorage:
+    with audioStorageLock:
+        audioFuture = audioStorage.get(audioId)
+    
+    if audioFuture is None:
         return jsonify({'error': 'Audio not found'}), 404
     
-    audioPath = audioStorage[audioId]
-    if not os.path.exists(audioPath):
-        return jsonify({'error': 'Audio file not found'}), 404
+    try:
+        audioBytes = audioFuture.result(timeout=30)
+    except Exception as e:
+        return jsonify({'error': f'Failed to encode audio: {str(e)}'}), 500
     
+    # Conditional responses let <audio> elements use Range requests and
+    # revalidate cached audio by ETag
     return send_file(
-        audioPath,
+        io.BytesIO(audioBytes),
         mimetype='audio/wav',
         as_attachment=False,
-        download_name='translated.wav'
+        download_name='translated.wav',
+        conditional=True,
+        etag=audioId,
+        max_age=300
     )
 
 
@@ -207,6 +353,9 @@ def health():
 
 
 if __name__ == '__main__':
-    # Run development server
+    # Run development server. With debug=True the reloader re-runs this
+    # block in a child process; only that serving process loads models.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        warmUpTranslators()
     app.run(host='0.0.0.0', port=5000, debug=True)
 
@@ -32,6 +32,26 @@ class AudioInput:
         self.audio = None
         self.stream = None
     
+    def _openStream(self):
+        """Open a microphone stream, initializing PortAudio on first use."""
+        if self.audio is None:
+            self.audio = pyaudio.PyAudio()
+        
+        self.stream = self.audio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self.sampleRate,
+            input=True,
+            frames_per_buffer=self.chunkSize
+        )
+    
+    def _closeStream(self):
+        """Stop and close the current microphone stream."""
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+    
     def loadFromFile(self, filePath: str) -> Tuple[np.ndarray, int]:
         """
         Load audio from file.
@@ -42,11 +62,14 @@ class AudioInput:
         Returns:
             Tuple of (audioData, sampleRate)
         """
-        audioData, sampleRate = sf.read(filePath)
+        audioData, sampleRate = sf.read(filePath, dtype='float32')
         
-        # Convert to mono if stereo
-        if len(audioData.shape) > 1:
-            audioData = np.mean(audioData, axis=1)
+        # Convert to mono if stereo, staying in float32
+        if audioData.ndim > 1:
+            if audioData.shape[1] == 2:
+                audioData = (audioData[:, 0] + audioData[:, 1]) * np.float32(0.5)
+            else:
+                audioData = audioData.mean(axis=1, dtype=np.float32)
         
         return audioData, sampleRate
     
@@ -65,16 +88,7 @@ class AudioInput:
         Returns:
             Tuple of (audioData, sampleRate)
         """
-        self.audio = pyaudio.PyAudio()
-        
-        # Open audio stream
-        self.stream = self.audio.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=self.sampleRate,
-            input=True,
-            frames_per_buffer=self.chunkSize
-        )
+        self._openStream()
         
         print(f"Recording for {duration} seconds...")
         frames = []
@@ -85,10 +99,8 @@ class AudioInput:
         
         print("Recording finished!")
         
-        # Stop and close stream
-        self.stream.stop_stream()
-        self.stream.close()
-        self.audio.terminate()
+        # Close the stream; PortAudio stays initialized for the next recording
+        self._closeStream()
         
         # Convert to numpy array
         audioData = np.frombuffer(b''.join(frames), dtype=np.int16)
@@ -117,29 +129,23 @@ class AudioInput:
         Returns:
             Tuple of (audioData, sampleRate)
         """
-        self.audio = pyaudio.PyAudio()
-        
-        # Open audio stream
-        self.stream = self.audio.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=self.sampleRate,
-            input=True,
-            frames_per_buffer=self.chunkSize
-        )
+        self._openStream()
         
         print("Recording... (speak now, silence will stop recording)")
         frames = []
         silenceCount = 0
         maxFrames = int(self.sampleRate / self.chunkSize * maxDuration)
         
+        # Compare in the int16 domain to avoid a float conversion per chunk
+        intThreshold = int(silenceThreshold * 32768)
+        
         for i in range(maxFrames):
             data = self.stream.read(self.chunkSize)
             frames.append(data)
             
-            # Check for silence
-            audioChunk = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-            if np.abs(audioChunk).mean() < silenceThreshold:
+            # Check for silence (abs in int32, since int16 abs wraps at -32768)
+            audioChunk = np.frombuffer(data, dtype=np.int16)
+            if np.abs(audioChunk, dtype=np.int32).mean() < intThreshold:
                 silenceCount += 1
                 if silenceCount > 10:  # 10 consecutive silent chunks
                     print("Silence detected, stopping recording...")
@@ -149,14 +155,15 @@ class AudioInput:
         
         print("Recording finished!")
         
-        # Stop and close stream
-        self.stream.stop_stream()
-        self.stream.close()
-        self.audio.terminate()
+        # Close the stream; PortAudio stays initialized for the next recording
+        self._closeStream()
         
-        # Convert to numpy array
-        audioData = np.frombuffer(b''.join(frames), dtype=np.int16)
-        audioData = audioData.astype(np.float32) / 32768.0  # Normalize to [-1, 1]
+        # Convert to numpy array, normalizing to [-1, 1] in a single pass
+        audioData = np.multiply(
+            np.frombuffer(b''.join(frames), dtype=np.int16),
+            np.float32(1.0 / 32768.0),
+            dtype=np.float32
+        )
         
         # Save to file if path provided
         if outputPath:
@@ -166,9 +173,8 @@ class AudioInput:
     
     def cleanup(self):
         """Clean up audio resources."""
-        if self.stream:
-            self.stream.stop_stream()
-            self.stream.close()
+        self._closeStream()
         if self.audio:
             self.audio.terminate()
+            self.audio = None
 
@@ -6,6 +6,7 @@ This module handles audio playback functionality.
 
 import pygame
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 import os
 
@@ -18,7 +19,8 @@ class AudioPlayer:
         pygame.mixer.init()
         self.isPlaying = False
         self.currentFile: Optional[str] = None
-        self.playbackThread: Optional[threading.Thread] = None
+        self.playbackExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AudioPlayer")
+        self.stopEvent = threading.Event()
         self.onPlaybackFinished: Optional[Callable[[], None]] = None
     
     def play(self, audioPath: str, onFinished: Optional[Callable[[], None]] = None) -> bool:
@@ -44,12 +46,11 @@ class AudioPlayer:
             self.onPlaybackFinished = onFinished
             self.isPlaying = True
             
-            # Start playback in separate thread
-            self.playbackThread = threading.Thread(
-                target=self._playbackLoop,
-                daemon=True
-            )
-            self.playbackThread.start()
+            # Each playback gets its own event so a stale loop can't miss its wakeup
+            self.stopEvent = threading.Event()
+            
+            # Run playback on the player's worker thread
+            self.playbackExecutor.submit(self._playbackLoop, self.stopEvent)
             
             return True
         except Exception as e:
@@ -57,15 +58,14 @@ class AudioPlayer:
             self.isPlaying = False
             return False
     
-    def _playbackLoop(self):
-        """Internal playback loop running in separate thread."""
+    def _playbackLoop(self, stopEvent: threading.Event):
+        """Internal playback loop running on the playback executor."""
         try:
-            pygame.mixer.music.load(self.currentFile)
-            pygame.mixer.music.play()
+            sound = pygame.mixer.Sound(self.currentFile)
+            sound.play()
             
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.wait(100)
+            # Block until the clip ends or stop() sets the event
+            stopEvent.wait(sound.get_length())
             
             # Playback finished
             if self.onPlaybackFinished:
@@ -73,12 +73,15 @@ class AudioPlayer:
         except Exception as e:
             print(f"Error in playback loop: {e}")
         finally:
-            self.isPlaying = False
+            # A newer play() call owns isPlaying once it has replaced the event
+            if stopEvent is self.stopEvent:
+                self.isPlaying = False
     
     def stop(self):
         """Stop audio playback."""
         if self.isPlaying:
-            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+            self.stopEvent.set()
             self.isPlaying = False
     
     def isCurrentlyPlaying(self) -> bool:
@@ -88,5 +91,6 @@ class AudioPlayer:
     def cleanup(self):
         """Clean up audio player resources."""
         self.stop()
+        self.playbackExecutor.shutdown(wait=False)
         pygame.mixer.quit()
 
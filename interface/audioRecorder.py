@@ -9,7 +9,6 @@ import numpy as np
 import soundfile as sf
 import pyaudio
 from typing import Optional, Tuple, Callable
-import threading
 import time
 import tempfile
 import os
@@ -23,7 +22,8 @@ class AudioRecorder:
         sampleRate: int = 16000,
         chunkSize: int = 1024,
         channels: int = 1,
-        format: int = pyaudio.paInt16
+        format: int = pyaudio.paInt16,
+        bufferDuration: float = 60.0
     ):
         """
         Initialize audio recorder.
@@ -33,17 +33,22 @@ class AudioRecorder:
             chunkSize: Chunk size for audio buffer
             channels: Number of audio channels (1 = mono, 2 = stereo)
             format: Audio format (paInt16, paFloat32, etc.)
+            bufferDuration: Initial recording buffer capacity in seconds
+                (the buffer grows if a recording exceeds it)
         """
         self.sampleRate = sampleRate
         self.chunkSize = chunkSize
         self.channels = channels
         self.format = format
+        self.bufferDuration = bufferDuration
         self.audio = None
         self.stream = None
         self.isRecording = False
-        self.recordedFrames = []
-        self.recordingThread = None
+        self.recordedBuffer: Optional[np.ndarray] = None
+        self.writeIndex = 0
         self.onRecordingUpdate: Optional[Callable[[float], None]] = None  # Callback for recording duration
+        self.updateInterval = 0.1  # Minimum seconds between onRecordingUpdate calls
+        self.nextUpdateAt = 0.0
     
     def startRecording(self, outputPath: Optional[str] = None) -> bool:
         """
@@ -59,55 +64,77 @@ class AudioRecorder:
             return False
         
         try:
+            # Preallocate the sample buffer so chunks are copied in place
+            maxFrames = int(np.ceil(self.sampleRate * self.bufferDuration / self.chunkSize))
+            self.recordedBuffer = np.empty(maxFrames * self.chunkSize * self.channels, dtype=np.int16)
+            self.writeIndex = 0
+            
+            self.isRecording = True
+            self.startTime = time.time()
+            self.nextUpdateAt = self.startTime
+            
+            # PortAudio delivers chunks to the callback from its own I/O thread
             self.audio = pyaudio.PyAudio()
             self.stream = self.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.sampleRate,
                 input=True,
-                frames_per_buffer=self.chunkSize
-            )
-            
-            self.isRecording = True
-            self.recordedFrames = []
-            self.startTime = time.time()
-            
-            # Start recording thread
-            self.recordingThread = threading.Thread(
-                target=self._recordingLoop,
-                args=(outputPath,),
-                daemon=True
+                frames_per_buffer=self.chunkSize,
+                stream_callback=self._paCallback
             )
-            self.recordingThread.start()
             
             return True
         except Exception as e:
             print(f"Error starting recording: {e}")
-            self.stopRecording()
+            self.isRecording = False
+            self._closeStream()
             return False
     
-    def _recordingLoop(self, outputPath: Optional[str] = None):
-        """Internal recording loop running in separate thread."""
+    def _paCallback(self, inData, frameCount, timeInfo, status):
+        """PyAudio stream callback storing each captured chunk."""
         try:
-            while self.isRecording:
-                data = self.stream.read(self.chunkSize, exception_on_overflow=False)
-                self.recordedFrames.append(data)
-                
-                # Call update callback if provided
-                if self.onRecordingUpdate:
-                    duration = time.time() - self.startTime
-                    self.onRecordingUpdate(duration)
-                
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.01)
+            self._appendChunk(np.frombuffer(inData, dtype=np.int16))
+            self._notifyUpdate()
         except Exception as e:
-            print(f"Error in recording loop: {e}")
-        finally:
-            if self.stream:
+            print(f"Error in recording callback: {e}")
+            return (None, pyaudio.paAbort)
+        return (None, pyaudio.paContinue)
+    
+    def _closeStream(self):
+        """Stop the capture stream and release PortAudio."""
+        if self.stream:
+            try:
                 self.stream.stop_stream()
                 self.stream.close()
-            if self.audio:
+            except Exception:
+                pass
+            self.stream = None
+        if self.audio:
+            try:
                 self.audio.terminate()
+            except Exception:
+                pass
+            self.audio = None
+    
+    def _appendChunk(self, chunk: np.ndarray):
+        """Copy a chunk of samples into the recording buffer, growing it if full."""
+        endIndex = self.writeIndex + len(chunk)
+        if endIndex > len(self.recordedBuffer):
+            grownBuffer = np.empty(max(2 * len(self.recordedBuffer), endIndex), dtype=np.int16)
+            grownBuffer[:self.writeIndex] = self.recordedBuffer[:self.writeIndex]
+            self.recordedBuffer = grownBuffer
+        self.recordedBuffer[self.writeIndex:endIndex] = chunk
+        self.writeIndex = endIndex
+    
+    def _notifyUpdate(self):
+        """Call the update callback, at most once per updateInterval."""
+        if not self.onRecordingUpdate:
+            return
+        now = time.time()
+        if now >= self.nextUpdateAt:
+            self.nextUpdateAt = now + self.updateInterval
+            self.onRecordingUpdate(now - self.startTime)
     
     def stopRecording(self) -> Optional[Tuple[np.ndarray, int]]:
         """
@@ -121,22 +148,24 @@ class AudioRecorder:
         
         self.isRecording = False
         
-        # Wait for recording thread to finish
-        if self.recordingThread:
-            self.recordingThread.join(timeout=2.0)
+        # stop_stream waits for any in-flight callback to return
+        self._closeStream()
         
-        # Convert frames to numpy array
-        if not self.recordedFrames:
+        # Convert recorded samples to numpy array
+        if self.recordedBuffer is None or self.writeIndex == 0:
             return None
         
         try:
-            # Convert to numpy array
-            audioData = np.frombuffer(b''.join(self.recordedFrames), dtype=np.int16)
-            audioData = audioData.astype(np.float32) / 32768.0  # Normalize to [-1, 1]
+            # Normalize to [-1, 1] in a single pass over the recorded samples
+            audioData = np.multiply(
+                self.recordedBuffer[:self.writeIndex],
+                np.float32(1.0 / 32768.0),
+                dtype=np.float32
+            )
             
-            # Convert to mono if stereo
-            if self.channels > 1 and len(audioData.shape) > 1:
-                audioData = np.mean(audioData, axis=1)
+            # Convert to mono if stereo (samples are interleaved)
+            if self.channels > 1:
+                audioData = audioData.reshape(-1, self.channels).mean(axis=1)
             
             return audioData, self.sampleRate
         except Exception as e:
@@ -176,15 +205,5 @@ class AudioRecorder:
     def cleanup(self):
         """Clean up audio resources."""
         self.stopRecording()
-        if self.stream:
-            try:
-                self.stream.stop_stream()
-                self.stream.close()
-            except:
-                pass
-        if self.audio:
-            try:
-                self.audio.terminate()
-            except:
-                pass
+        self._closeStream()
 
@@ -6,10 +6,12 @@ This module provides a GUI for recording, translating, and playing back voice.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
 import os
 import tempfile
-from typing import Optional
+import numpy as np
+import soundfile as sf
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from models.voiceTranslator import VoiceTranslator
 from models.utils.languageConfig import LanguageConfig, LanguageCode
 from interface.audioRecorder import AudioRecorder
@@ -19,6 +21,8 @@ from interface.audioPlayer import AudioPlayer
 class VoiceTranslatorGUI:
     """Main GUI application for voice translator."""
     
+    LANGUAGE_CHOICES = (LanguageCode.PORTUGUESE_BR, LanguageCode.ENGLISH)
+    
     def __init__(self, root: tk.Tk):
         """
         Initialize GUI application.
@@ -36,16 +40,33 @@ class VoiceTranslatorGUI:
         self.audioRecorder.onRecordingUpdate = self.updateRecordingDuration
         self.audioPlayer = AudioPlayer()
         self.voiceTranslator: Optional[VoiceTranslator] = None
+        self.translatorCache: Dict[Tuple[str, str], VoiceTranslator] = {}
+        
+        # Shared pool for model loading and translation, so repeated clicks
+        # queue up instead of oversubscribing the CPU/GPU with new threads
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="VoiceTranslatorGUI")
         
         # State variables
         self.isRecording = False
-        self.recordedAudioPath: Optional[str] = None
-        self.translatedAudioPath: Optional[str] = None
+        self.translatedAudioPath = os.path.join(tempfile.gettempdir(), "voice_translator_translated.wav")
+        self.translatedReady = False  # Whether translatedAudioPath holds the current translation
         self.currentSourceLanguage = LanguageCode.PORTUGUESE_BR
         self.currentTargetLanguage = LanguageCode.ENGLISH
+        self.languageReloadJob: Optional[str] = None
+        self.revertingLanguage = False
+        self.latestDuration = 0.0  # Written by the audio thread, read by _durationPoll
+        self.durationPollJob: Optional[str] = None
+        
+        # Start loading models first so widget construction overlaps with it
+        self.executor.submit(
+            self._loadTranslatorWorker,
+            self.currentSourceLanguage,
+            self.currentTargetLanguage
+        )
         
         # Create UI
         self.createWidgets()
+        self._showTranslatorLoading()
         
         # Cleanup on close
         self.root.protocol("WM_DELETE_WINDOW", self.onClose)
@@ -81,12 +102,11 @@ class VoiceTranslatorGUI:
         sourceLangCombo = ttk.Combobox(
             langFrame,
             textvariable=self.sourceLangVar,
-            values=[LanguageCode.PORTUGUESE_BR, LanguageCode.ENGLISH],
+            values=self.LANGUAGE_CHOICES,
             state="readonly",
             width=20
         )
         sourceLangCombo.grid(row=0, column=1, padx=(0, 20))
-        sourceLangCombo.bind("<<ComboboxSelected>>", self.onLanguageChanged)
         
         # Target language
         ttk.Label(langFrame, text="To:").grid(row=0, column=2, padx=(0, 5))
@@ -94,12 +114,15 @@ class VoiceTranslatorGUI:
         targetLangCombo = ttk.Combobox(
             langFrame,
             textvariable=self.targetLangVar,
-            values=[LanguageCode.PORTUGUESE_BR, LanguageCode.ENGLISH],
+            values=self.LANGUAGE_CHOICES,
             state="readonly",
             width=20
         )
         targetLangCombo.grid(row=0, column=3)
-        targetLangCombo.bind("<<ComboboxSelected>>", self.onLanguageChanged)
+        
+        # Single change path for both selections
+        self.sourceLangVar.trace_add("write", self.onLanguageChanged)
+        self.targetLangVar.trace_add("write", self.onLanguageChanged)
         
         # Recording frame
         recordFrame = ttk.LabelFrame(mainFrame, text="Recording", padding="10")
@@ -179,46 +202,110 @@ class VoiceTranslatorGUI:
             length=400
         )
         self.progressBar.grid(row=6, column=0, columnspan=3, pady=(0, 10), sticky=(tk.W, tk.E))
-        
-        # Initialize translator
-        self.initializeTranslator()
     
-    def onLanguageChanged(self, event=None):
-        """Handle language selection change."""
+    def onLanguageChanged(self, *args):
+        """Handle language selection change (trace callback on both language variables)."""
+        if self.revertingLanguage:
+            return
+        
         sourceLang = self.sourceLangVar.get()
         targetLang = self.targetLangVar.get()
         
+        if sourceLang == self.currentSourceLanguage and targetLang == self.currentTargetLanguage:
+            return
+        
         if sourceLang == targetLang:
             messagebox.showwarning(
                 "Invalid Selection",
                 "Source and target languages must be different!"
             )
-            # Revert to previous selection
-            self.sourceLangVar.set(self.currentSourceLanguage)
-            self.targetLangVar.set(self.currentTargetLanguage)
+            # Revert to previous selection without re-entering this handler
+            self.revertingLanguage = True
+            try:
+                self.sourceLangVar.set(self.currentSourceLanguage)
+                self.targetLangVar.set(self.currentTargetLanguage)
+            finally:
+                self.revertingLanguage = False
             return
         
         self.currentSourceLanguage = sourceLang
         self.currentTargetLanguage = targetLang
         
-        # Reinitialize translator with new languages
+        # Reinitialize translator once the selection settles, so changing
+        # both comboboxes in a row only reloads the models once
+        if self.languageReloadJob is not None:
+            self.root.after_cancel(self.languageReloadJob)
+        self.languageReloadJob = self.root.after(300, self._doLanguageReload)
+    
+    def _doLanguageReload(self):
+        """Reinitialize translator after a debounced language change."""
+        self.languageReloadJob = None
         self.initializeTranslator()
     
     def initializeTranslator(self):
         """Initialize voice translator with current language settings."""
+        # Each direction's models are only loaded once per session
+        cachedTranslator = self.translatorCache.get(
+            (self.currentSourceLanguage, self.currentTargetLanguage)
+        )
+        if cachedTranslator is not None:
+            self._onTranslatorReady(cachedTranslator)
+            return
+        
+        self._showTranslatorLoading()
+        
+        # Load models in the background so the window stays responsive
+        self.executor.submit(
+            self._loadTranslatorWorker,
+            self.currentSourceLanguage,
+            self.currentTargetLanguage
+        )
+    
+    def _showTranslatorLoading(self):
+        """Show that a translator load is in progress."""
+        self.statusLabel.config(text="Initializing translator...", foreground="blue")
+        if not self.isRecording:
+            self.recordButton.config(state=tk.DISABLED)
+        self.progressBar.start()
+    
+    def _loadTranslatorWorker(self, sourceLanguage: str, targetLanguage: str):
+        """Construct the voice translator off the Tk main thread."""
         try:
-            self.statusLabel.config(text="Initializing translator...", foreground="blue")
-            self.root.update()
-            
-            self.voiceTranslator = VoiceTranslator(
-                sourceLanguage=self.currentSourceLanguage,
-                targetLanguage=self.currentTargetLanguage
+            voiceTranslator = VoiceTranslator(
+                sourceLanguage=sourceLanguage,
+                targetLanguage=targetLanguage
             )
-            
-            self.statusLabel.config(text="Ready", foreground="green")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to initialize translator: {e}")
-            self.statusLabel.config(text="Error", foreground="red")
+            self.root.after(0, self._onTranslatorFailed, sourceLanguage, targetLanguage, e)
+            return
+        
+        self.root.after(0, self._onTranslatorReady, voiceTranslator)
+    
+    def _onTranslatorReady(self, voiceTranslator: VoiceTranslator):
+        """Install a loaded translator (runs on the Tk main thread)."""
+        key = (voiceTranslator.sourceLanguage, voiceTranslator.targetLanguage)
+        self.translatorCache[key] = voiceTranslator
+        
+        # Don't install loads superseded by a later language change
+        if voiceTranslator.sourceLanguage != self.currentSourceLanguage or \
+           voiceTranslator.targetLanguage != self.currentTargetLanguage:
+            return
+        
+        self.voiceTranslator = voiceTranslator
+        self.progressBar.stop()
+        self.recordButton.config(state=tk.NORMAL)
+        self.statusLabel.config(text="Ready", foreground="green")
+    
+    def _onTranslatorFailed(self, sourceLanguage: str, targetLanguage: str, error: Exception):
+        """Report a failed translator load (runs on the Tk main thread)."""
+        if sourceLanguage != self.currentSourceLanguage or \
+           targetLanguage != self.currentTargetLanguage:
+            return
+        
+        self.progressBar.stop()
+        self.recordButton.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"Failed to initialize translator: {error}")
+        self.statusLabel.config(text="Error", foreground="red")
     
     def toggleRecording(self):
         """Toggle recording state."""
@@ -232,14 +319,14 @@ class VoiceTranslatorGUI:
         if self.isRecording:
             return
         
-        # Create temporary file for recording
-        self.recordedAudioPath = os.path.join(tempfile.gettempdir(), "voice_translator_recording.wav")
-        
+        self.latestDuration = 0.0
         if self.audioRecorder.startRecording():
             self.isRecording = True
             self.recordButton.config(text="⏹ Stop Recording", state=tk.NORMAL)
             self.statusLabel.config(text="Recording...", foreground="red")
             self.clearTexts()
+            self._cancelDurationPoll()
+            self._durationPoll()
         else:
             messagebox.showerror("Error", "Failed to start recording. Check microphone permissions.")
     
@@ -249,37 +336,39 @@ class VoiceTranslatorGUI:
             return
         
         self.isRecording = False
+        self._cancelDurationPoll()
+        self.durationLabel.config(text=f"Duration: {self.latestDuration:.1f}s")
         self.recordButton.config(text="🎤 Start Recording", state=tk.NORMAL)
         self.statusLabel.config(text="Processing...", foreground="blue")
         self.progressBar.start()
         
-        # Stop recording in separate thread to avoid blocking
-        threading.Thread(target=self.processRecording, daemon=True).start()
+        # Stop the microphone right away; closing the stream is quick, and the
+        # recording must not keep growing while translation waits for a worker
+        audioData = self.audioRecorder.stopRecording()
+        if audioData is None:
+            self._finishProcessing(False, "", "")
+            return
+        
+        # Translate on the worker pool to avoid blocking
+        audioArray, sampleRate = audioData
+        self.executor.submit(self.processRecording, audioArray, sampleRate)
     
-    def processRecording(self):
-        """Process recorded audio and translate."""
+    def processRecording(self, audioArray: np.ndarray, sampleRate: int):
+        """
+        Translate recorded audio.
+        
+        Args:
+            audioArray: Recorded audio samples
+            sampleRate: Sample rate of the recording
+        """
         try:
-            # Stop recording and get audio data
-            audioData = self.audioRecorder.stopRecording()
-            
-            if audioData is None:
-                self.root.after(0, lambda: self.statusLabel.config(text="Recording failed", foreground="red"))
-                self.root.after(0, self.progressBar.stop)
-                return
-            
-            audioArray, sampleRate = audioData
-            
-            # Save recording to file
-            if not self.audioRecorder.saveRecording(audioArray, sampleRate, self.recordedAudioPath):
-                self.root.after(0, lambda: self.statusLabel.config(text="Failed to save recording", foreground="red"))
-                self.root.after(0, self.progressBar.stop)
-                return
-            
-            # Translate audio
+            # Translate audio (retry loading if startup initialization failed)
             if self.voiceTranslator is None:
-                self.initializeTranslator()
-            
-            self.root.after(0, lambda: self.statusLabel.config(text="Transcribing...", foreground="blue"))
+                self.voiceTranslator = VoiceTranslator(
+                    sourceLanguage=self.currentSourceLanguage,
+                    targetLanguage=self.currentTargetLanguage
+                )
+                self.translatorCache[(self.currentSourceLanguage, self.currentTargetLanguage)] = self.voiceTranslator
             
             transcribedText, translatedText, translatedAudio = self.voiceTranslator.translateAudioFromArray(
                 audioArray=audioArray,
@@ -289,20 +378,47 @@ class VoiceTranslatorGUI:
             )
             
             # Save translated audio
-            self.translatedAudioPath = os.path.join(tempfile.gettempdir(), "voice_translator_translated.wav")
-            import soundfile as sf
             if translatedAudio is not None:
-                sf.write(self.translatedAudioPath, translatedAudio, 16000)
+                sf.write(
+                    self.translatedAudioPath,
+                    np.ascontiguousarray(translatedAudio, dtype=np.float32),
+                    16000,
+                    subtype='PCM_16'
+                )
             
             # Update UI in main thread
-            self.root.after(0, lambda: self.updateResults(transcribedText, translatedText))
+            self.root.after(
+                0, self._finishProcessing, True, transcribedText, translatedText, None,
+                translatedAudio is not None
+            )
             
         except Exception as e:
             errorMsg = f"Translation error: {e}"
             print(errorMsg)
-            self.root.after(0, lambda: messagebox.showerror("Error", errorMsg))
-            self.root.after(0, lambda: self.statusLabel.config(text="Error", foreground="red"))
-            self.root.after(0, self.progressBar.stop)
+            self.root.after(0, self._finishProcessing, False, "", "", errorMsg)
+    
+    def _finishProcessing(
+        self,
+        ok: bool,
+        originalText: str,
+        translatedText: str,
+        errorMsg: Optional[str] = None,
+        audioWritten: bool = False
+    ):
+        """Apply the outcome of processRecording in a single Tk callback."""
+        self.progressBar.stop()
+        
+        if ok:
+            self.translatedReady = audioWritten
+            self.updateResults(originalText, translatedText)
+        elif errorMsg:
+            self._showError(errorMsg)
+        else:
+            self.statusLabel.config(text="Recording failed", foreground="red")
+    
+    def _showError(self, errorMsg: str):
+        """Show an error in the status label without blocking on a dialog."""
+        self.statusLabel.config(text=errorMsg[:80], foreground="red")
     
     def updateResults(self, originalText: str, translatedText: str):
         """Update UI with translation results."""
@@ -323,10 +439,11 @@ class VoiceTranslatorGUI:
         
         # Update status
         self.statusLabel.config(text="Translation complete!", foreground="green")
-        self.progressBar.stop()
     
     def clearTexts(self):
         """Clear text areas."""
+        self.translatedReady = False
+        
         self.originalText.config(state=tk.NORMAL)
         self.originalText.delete(1.0, tk.END)
         self.originalText.config(state=tk.DISABLED)
@@ -338,18 +455,30 @@ class VoiceTranslatorGUI:
         self.playButton.config(state=tk.DISABLED)
     
     def updateRecordingDuration(self, duration: float):
-        """Update recording duration display."""
+        """Store latest recording duration (called from the audio thread)."""
+        self.latestDuration = duration
+    
+    def _durationPoll(self):
+        """Refresh the duration label every 100 ms while recording."""
+        self.durationPollJob = None
         if self.isRecording:
-            self.root.after(0, lambda: self.durationLabel.config(text=f"Duration: {duration:.1f}s"))
+            self.durationLabel.config(text=f"Duration: {self.latestDuration:.1f}s")
+            self.durationPollJob = self.root.after(100, self._durationPoll)
+    
+    def _cancelDurationPoll(self):
+        """Cancel a pending duration label refresh, if any."""
+        if self.durationPollJob is not None:
+            self.root.after_cancel(self.durationPollJob)
+            self.durationPollJob = None
     
     def playTranslatedAudio(self):
         """Play translated audio."""
-        if self.translatedAudioPath and os.path.exists(self.translatedAudioPath):
+        if self.translatedReady:
             if self.audioPlayer.play(self.translatedAudioPath, self.onPlaybackFinished):
                 self.playButton.config(state=tk.DISABLED)
                 self.stopButton.config(state=tk.NORMAL)
             else:
-                messagebox.showerror("Error", "Failed to play audio")
+                self._showError("Failed to play audio")
         else:
             messagebox.showwarning("Warning", "No translated audio available")
     
@@ -365,8 +494,12 @@ class VoiceTranslatorGUI:
     
     def onClose(self):
         """Handle window close event."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.audioRecorder.cleanup()
         self.audioPlayer.cleanup()
+        for voiceTranslator in self.translatorCache.values():
+            if hasattr(voiceTranslator, "cleanup"):
+                voiceTranslator.cleanup()
         self.root.destroy()
 
 
@@ -8,9 +8,7 @@ between Portuguese (Brazil) and English.
 import argparse
 import os
 import sys
-from models.voiceTranslator import VoiceTranslator
 from models.utils.languageConfig import LanguageConfig, LanguageCode
-from interface.audioInput import AudioInput
 
 
 def main():
@@ -68,6 +66,10 @@ def main():
         print("Error: Source and target languages must be different")
         sys.exit(1)
     
+    # Imported here so --help and argument errors don't load the ML stack
+    from models.voiceTranslator import VoiceTranslator
+    from interface.audioInput import AudioInput
+    
     try:
         # Initialize voice translator
         print(f"Initializing voice translator: {LanguageConfig.getLanguageName(args.source)} -> {LanguageConfig.getLanguageName(args.target)}")
@@ -104,21 +106,13 @@ def main():
                         duration=args.record_duration
                     )
                 
-                # Save temporary recording
-                tempInputPath = "temp_input.wav"
-                import soundfile as sf
-                sf.write(tempInputPath, audioData, sampleRate)
-                
                 print("Processing recorded audio...")
-                transcribedText, translatedText, audioData = translator.translateAudio(
-                    audioPath=tempInputPath,
+                transcribedText, translatedText, audioData = translator.translateAudioFromArray(
+                    audioArray=audioData,
+                    sampleRate=sampleRate,
                     outputAudioPath=args.output,
                     returnText=True
                 )
-                
-                # Clean up temporary file
-                if os.path.exists(tempInputPath):
-                    os.remove(tempInputPath)
             
             finally:
                 audioInput.cleanup()
@@ -14,8 +14,6 @@ except ImportError:
 except Exception as e:
     print(f"⚠ Error loading .env file: {e}")
 
-from api.webServer import app
-
 if __name__ == '__main__':
     print("=" * 50)
     print("Voice Translator Web Server")
@@ -30,8 +28,22 @@ if __name__ == '__main__':
         print("⚠ No Hugging Face token found (may be required for some models)")
         print("  Create a .env file with HF_TOKEN=your_token")
     
+    # Imported after the token check so startup messages appear before the ML stack loads
+    from api.webServer import app, warmUpTranslators
+    
+    print("Loading translation models...")
+    warmUpTranslators()
+    
     print("Starting server on http://0.0.0.0:5000")
     print("Open your browser and navigate to: http://localhost:5000")
     print("=" * 50)
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    
+    # Serve with waitress's thread pool so one translation doesn't block other requests
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠ waitress not installed, falling back to the Flask development server")
+        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=4)
 